@@ -0,0 +1 @@
+from .bar_tools import *
@@ -0,0 +1,854 @@
+"""
+This file contains the Python implementation of Backup and Restore (BAR) tools
+for the Teradata MCP server. The tools manage DSA (Data Stream Architecture)
+backup targets - disk file systems, AWS S3 configurations and media servers -
+through the DSA REST API via the shared dsa_client.
+"""
+
+import atexit
+import functools
+import io
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from dataclasses import asdict, dataclass
+from itertools import chain
+from pathlib import Path
+from typing import Final
+
+from teradatasql import TeradataConnection
+
+from teradata_mcp_server.tools.utils import create_response
+from teradata_mcp_server.utils import _default_log_dir
+
+from .dsa_client import DsaResponse, _dumps, dsa_client
+
+try:
+    # orjson's C parser decodes the JSON tool arguments; the final response
+    # encode happens once, centrally, in create_response. _fmt stays for the
+    # odd caller that needs a human-readable string.
+    import orjson
+
+    def _fmt(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    loads = orjson.loads
+except ImportError:
+    import json
+
+    def _fmt(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+    loads = json.loads
+
+# Child of the server logger: records still propagate to the shared
+# console/jsonl handlers, while the BAR file handler below attaches here so
+# bar_tools.log only ever receives BAR/DSA records.
+logger = logging.getLogger("teradata_mcp_server.bar")
+
+# Dedicated file log for BAR/DSA API traffic so it can be audited without
+# raising the server-wide log level. Records are handed off through an
+# in-memory queue and written by a background listener thread, so tool calls
+# never block on disk I/O; records are batched and flushed immediately at
+# ERROR and above.
+_file_handler: logging.FileHandler | None = None
+_buffer_handler: logging.handlers.MemoryHandler | None = None
+_log_listener: logging.handlers.QueueListener | None = None
+
+
+def _resolve_log_dir() -> Path | None:
+    """Resolve the BAR log directory with the same knobs as setup_logging.
+
+    Honors NO_FILE_LOGS and the LOG_DIR override, and otherwise uses the
+    per-user default for the configured transport (None under stdio, where
+    file logging is off by default).
+    """
+    if os.getenv("NO_FILE_LOGS", "").lower() in {"1", "true", "yes"}:
+        return None
+    log_dir = os.getenv("LOG_DIR") or _default_log_dir(os.getenv("MCP_TRANSPORT", "stdio"))
+    return Path(log_dir) if log_dir else None
+
+
+LOG_DIR: Final = _resolve_log_dir()
+
+
+def _init_logging() -> None:
+    """Attach the BAR file log to the shared logger, exactly once.
+
+    Guarded so re-imports in worker processes neither stack duplicate
+    handlers nor repeat the directory/open syscalls.
+    """
+    global _file_handler, _buffer_handler, _log_listener
+    if LOG_DIR is None:
+        return
+    log_file = str(LOG_DIR / 'bar_tools.log')
+    for handler in logger.handlers:
+        if getattr(handler, '_bar_log_file', None) == log_file:
+            return
+    try:
+        if not LOG_DIR.is_dir():
+            LOG_DIR.mkdir(parents=True, exist_ok=True)
+        _file_handler = logging.FileHandler(log_file)
+    except OSError as e:
+        # Same policy as setup_logging: an unwritable log directory disables
+        # file logging, it must never keep the module from loading.
+        logger.warning("BAR file logging disabled, cannot write %s: %s", log_file, e)
+        return
+    _file_handler.setLevel(logging.DEBUG)
+    _file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    _buffer_handler = logging.handlers.MemoryHandler(64, flushLevel=logging.ERROR, target=_file_handler)
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler._bar_log_file = log_file
+    logger.addHandler(queue_handler)
+    _log_listener = logging.handlers.QueueListener(log_queue, _buffer_handler, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_stop_bar_logging)
+    logger.info("BAR tools logging DSA API traffic to %s", log_file)
+
+
+def _stop_bar_logging() -> None:
+    if _log_listener is not None:
+        _log_listener.stop()
+        _buffer_handler.close()
+        _file_handler.close()
+
+
+_init_logging()
+logger.info("BAR tools module loaded")
+
+# Separator and header constants for the human-readable reports below,
+# precomputed once so the per-call report builders only write them.
+SEP: Final = "=" * 50
+_SEP_NL: Final = SEP + "\n"
+_HDR_LIST_FS: Final = "🗂️ DSA Disk File Systems\n" + _SEP_NL
+_HDR_CONFIG_FS: Final = "🗂️ DSA Disk File System Configuration\n" + _SEP_NL
+_HDR_REMOVE_FS: Final = "🗂️ DSA Disk File System Removal\n" + _SEP_NL
+_HDR_DELETE_FS: Final = "🗂️ DSA Disk File System Deletion\n" + _SEP_NL
+_HDR_LIST_S3: Final = "☁️ AWS S3 Backup Configurations\n" + _SEP_NL
+_HDR_VALIDATION: Final = "🔍 Validation Details:\n"
+_FOOTER_OK: Final = _SEP_NL + "✅ Status: Success\n"
+
+
+# DSA REST endpoints and the status codes the backup-application endpoints
+# return on success, hoisted so the schema lives in one place.
+DISK_FS_ENDPOINT: Final = "dsa/components/backup-applications/disk-file-system"
+AWS_S3_ENDPOINT: Final = "dsa/components/backup-applications/aws-s3"
+STATUS_LIST_FS_OK: Final = 'LIST_DISK_FILE_SYSTEMS_SUCCESSFUL'
+STATUS_CONFIG_FS_OK: Final = 'CONFIG_DISK_FILE_SYSTEM_SUCCESSFUL'
+STATUS_DELETE_OK: Final = 'DELETE_COMPONENT_SUCCESSFUL'
+STATUS_LIST_AWS_OK: Final = 'LIST_AWS_S3_SUCCESSFUL'
+
+
+#------------------ Disk file system tools ------------------#
+
+def _render_validation_errors(validationlist: dict | None):
+    """Yield report lines for a DSA validationlist, header included."""
+    if not validationlist:
+        return
+    yield _HDR_VALIDATION
+    for error in validationlist.get('clientValidationList', ()):
+        yield f"  - Code {error.get('code', 'N/A')}: {error.get('message', 'Unknown error')}\n"
+    for error in validationlist.get('serverValidationList', ()):
+        yield f"  - Code {error.get('code', 'N/A')}: {error.get('message', 'Unknown error')}\n"
+
+
+@dataclass(slots=True)
+class DiskFileSystemList:
+    """Parsed disk file system listing, independent of presentation."""
+    status: str
+    file_systems: list
+    validationlist: dict | None
+
+
+@dataclass(slots=True)
+class S3ConfigList:
+    """Parsed AWS S3 backup configuration listing."""
+    status: str
+    configurations: list
+    validationlist: dict | None
+
+
+def _format_json(obj) -> str:
+    """Render a parsed tool result as compact JSON, skipping report building.
+
+    Machine callers that chain tools pick this via format="json" and avoid
+    the cost of building (and later parsing) the emoji report.
+    """
+    return _dumps(asdict(obj)).decode("utf-8")
+
+
+def _format_disk_fs_text(listing: DiskFileSystemList) -> str:
+    """Produce the human-readable disk file system report."""
+    buf = io.StringIO()
+    w = buf.write
+    w(_HDR_LIST_FS)
+
+    if listing.status == STATUS_LIST_FS_OK:
+        w(f"📊 Total File Systems: {len(listing.file_systems)}\n\n")
+        for fs in listing.file_systems:
+            w(f"  📁 Path: {fs.get('fileSystemPath', 'N/A')}\n")
+            w(f"     Max Files: {fs.get('maxFiles', 'N/A')}\n")
+        w(_FOOTER_OK)
+    else:
+        w(f"❌ Status: {listing.status}\n")
+        buf.writelines(_render_validation_errors(listing.validationlist))
+    return buf.getvalue()
+
+
+def list_disk_file_systems(format: str = "text") -> str:
+    """List the disk file systems configured as DSA backup targets.
+
+    format="json" returns the parsed structure as compact JSON instead of the
+    human-readable report.
+    """
+    response = dsa_client._make_request("GET", DISK_FS_ENDPOINT)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("DSA API response: %r", response)
+
+    listing = DiskFileSystemList(
+        status=response.status or 'UNKNOWN',
+        file_systems=response.body.get('fileSystems', []),
+        validationlist=response.validationlist,
+    )
+    if format == "json":
+        return _format_json(listing)
+    return _format_disk_fs_text(listing)
+
+
+def configure_disk_file_systems(entries: list[dict], replace_all: bool = False) -> str:
+    """Add or update several disk file systems with a single GET+POST.
+
+    The DSA endpoint replaces the full fileSystems array on every POST, so the
+    current configuration is fetched once and all requested entries are merged
+    in before a single POST - O(1) round-trips regardless of how many file
+    systems are being configured.
+
+    Each entry is a dict with 'file_system_path' and 'max_files' keys. With
+    replace_all=True the merge GET is skipped entirely and the requested
+    entries become the whole configuration - half the round-trips for the
+    common "reset config" usage.
+    """
+    if replace_all:
+        existing_file_systems = []
+    else:
+        response = dsa_client._cached_get(DISK_FS_ENDPOINT)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DSA API response: %r", response)
+        existing_file_systems = response.body.get('fileSystems', [])
+
+    requested = [{"fileSystemPath": entry["file_system_path"], "maxFiles": entry["max_files"]} for entry in entries]
+    by_path = {fs.get('fileSystemPath'): fs for fs in existing_file_systems}
+    updated_count = sum(1 for new_fs in requested if new_fs['fileSystemPath'] in by_path)
+    by_path.update((new_fs['fileSystemPath'], new_fs) for new_fs in requested)
+    file_systems_to_configure = list(by_path.values())
+
+    request_data = {"fileSystems": file_systems_to_configure}
+    response = dsa_client._make_request("POST", DISK_FS_ENDPOINT, data=request_data)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("DSA API response: %r", response)
+
+    buf = io.StringIO()
+    w = buf.write
+    w(_HDR_CONFIG_FS)
+    if response.status == STATUS_CONFIG_FS_OK:
+        w(f"✅ Added {len(requested) - updated_count} and updated {updated_count} file system(s):\n")
+        for new_fs in requested:
+            w(f"  📁 {new_fs['fileSystemPath']} (Max Files: {new_fs['maxFiles']})\n")
+        w(f"📊 Total File Systems: {len(file_systems_to_configure)}\n")
+    else:
+        w(f"❌ Status: {response.status or 'UNKNOWN'}\n")
+        buf.writelines(_render_validation_errors(response.validationlist))
+    return buf.getvalue()
+
+
+def config_disk_file_system(file_system_path: str, max_files: int, replace_all: bool = False) -> str:
+    """Add or update a single disk file system in the DSA backup configuration.
+
+    With replace_all=True the posted configuration contains only this entry.
+    """
+    return configure_disk_file_systems([{"file_system_path": file_system_path, "max_files": max_files}], replace_all)
+
+
+def remove_disk_file_system(file_system_path: str) -> str:
+    """Remove a single disk file system from the DSA backup configuration."""
+    response = dsa_client._cached_get(DISK_FS_ENDPOINT)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("DSA API response: %r", response)
+    existing_file_systems = response.body.get('fileSystems', [])
+
+    by_path = {fs.get('fileSystemPath'): fs for fs in existing_file_systems}
+    if file_system_path not in by_path:
+        # Re-removing a path that is already gone (e.g. a repeated idempotent
+        # remove within the GET-cache TTL) is a no-op; skip the POST entirely.
+        return f"ℹ️ File system '{file_system_path}' is not configured; no change."
+    by_path.pop(file_system_path)
+    file_systems_to_keep = list(by_path.values())
+
+    request_data = {"fileSystems": file_systems_to_keep}
+    response = dsa_client._make_request("POST", DISK_FS_ENDPOINT, data=request_data)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("DSA API response: %r", response)
+
+    buf = io.StringIO()
+    w = buf.write
+    w(_HDR_REMOVE_FS)
+    if response.status == STATUS_CONFIG_FS_OK:
+        w(f"✅ Removed file system: {file_system_path}\n")
+        w(f"📊 Remaining File Systems: {len(file_systems_to_keep)}\n")
+    else:
+        w(f"❌ Status: {response.status or 'UNKNOWN'}\n")
+        buf.writelines(_render_validation_errors(response.validationlist))
+    return buf.getvalue()
+
+
+def delete_disk_file_systems() -> str:
+    """Delete the entire disk file system backup-application component from DSA."""
+    response = dsa_client._make_request("DELETE", DISK_FS_ENDPOINT)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("DSA API response: %r", response)
+
+    buf = io.StringIO()
+    w = buf.write
+    w(_HDR_DELETE_FS)
+    if response.status == STATUS_DELETE_OK:
+        w("✅ Deleted all disk file systems from the DSA configuration\n")
+    else:
+        w(f"❌ Status: {response.status or 'UNKNOWN'}\n")
+        if validation := response.validationlist:
+            w(_HDR_VALIDATION)
+            for error in validation.get('clientValidationList', []):
+                w(f"  - Code {error.get('code', 'N/A')}: {error.get('message', 'Unknown error')}\n")
+            in_use = False
+            for error in validation.get('serverValidationList', []):
+                w(f"  - Code {error.get('code', 'N/A')}: {error.get('message', 'Unknown error')}\n")
+                in_use = in_use or 'in use by' in error.get('message', '')
+            if in_use:
+                w("\n💡 File systems that are in use by a backup job cannot be deleted.\n")
+                w("   Retire or repoint the referencing jobs and retry.\n")
+    return buf.getvalue()
+
+
+def _configure_disk_file_systems_from_json(file_systems: str, replace_all: bool = False) -> str:
+    """Decode and validate the config_batch JSON payload, then configure."""
+    try:
+        entries = loads(file_systems)
+    except ValueError as e:
+        return f"❌ file_systems must be a JSON array: {e}"
+    if not isinstance(entries, list) or not entries:
+        return "❌ file_systems must be a non-empty JSON array of {file_system_path, max_files} objects"
+    for entry in entries:
+        if not isinstance(entry, dict) or 'file_system_path' not in entry or 'max_files' not in entry:
+            return "❌ Each file_systems entry must be an object with 'file_system_path' and 'max_files' keys"
+    return configure_disk_file_systems(entries, replace_all)
+
+
+# Operation dispatch for manage_dsa_disk_file_systems: single source of truth
+# for the valid operations, their entry points and their required arguments.
+_DISK_OPS = {
+    "list": lambda args: list_disk_file_systems(args["format"]),
+    "config": lambda args: config_disk_file_system(args["file_system_path"], args["max_files"], args["replace_all"]),
+    "config_batch": lambda args: _configure_disk_file_systems_from_json(args["file_systems"], args["replace_all"]),
+    "remove": lambda args: remove_disk_file_system(args["file_system_path"]),
+    "delete_all": lambda args: delete_disk_file_systems(),
+}
+_DISK_OPS_REQUIRED = {
+    "config": ("file_system_path", "max_files"),
+    "config_batch": ("file_systems",),
+    "remove": ("file_system_path",),
+}
+_DISK_OPS_STR: Final = ", ".join(_DISK_OPS)
+
+
+def manage_dsa_disk_file_systems(
+    operation: str,
+    file_system_path: str | None = None,
+    max_files: int | None = None,
+    file_systems: str | None = None,
+    replace_all: bool = False,
+    format: str = "text",
+) -> str:
+    """Route a disk file system operation to the matching tool function."""
+    fn = _DISK_OPS.get(operation)
+    if fn is None:
+        return f"❌ Unknown operation '{operation}'. Available operations: {_DISK_OPS_STR}"
+    args = {"file_system_path": file_system_path, "max_files": max_files, "file_systems": file_systems, "replace_all": replace_all, "format": format}
+    for required in _DISK_OPS_REQUIRED.get(operation, ()):
+        if args[required] is None or args[required] == "":
+            return f"❌ {required} is required for the {operation} operation"
+    try:
+        return fn(args)
+    except Exception as e:
+        logger.error(f"Error executing disk file system operation '{operation}': {e}")
+        return f"❌ Error executing disk file system operation '{operation}': {e}"
+
+
+#------------------ AWS S3 tools ------------------#
+
+def _as_list(x) -> list:
+    """Normalize DSA's single-object-or-list JSON shapes to a list."""
+    if isinstance(x, list):
+        return x
+    return [] if x is None else [x]
+
+
+def _render_s3_config(config: dict):
+    """Yield the report lines for one AWS S3 configuration."""
+    config_rest = config.get('configAwsRest', {})
+    yield f"\n  ☁️ Configuration: {config_rest.get('name', 'N/A')}\n"
+    for region in _as_list(config_rest.get('bucketsByRegion')):
+        yield f"    🌍 Region: {region.get('region', 'N/A')}\n"
+        for bucket in _as_list(region.get('buckets')):
+            yield f"      🪣 Bucket: {bucket.get('bucketName', 'N/A')}\n"
+            for prefix in _as_list(bucket.get('prefixList')):
+                yield f"        📂 Prefix: {prefix.get('prefixName', 'N/A')}\n"
+
+
+def _format_s3_text(listing: S3ConfigList) -> str:
+    """Produce the human-readable AWS S3 configuration report."""
+    buf = io.StringIO()
+    w = buf.write
+    w(_HDR_LIST_S3)
+
+    if listing.status == STATUS_LIST_AWS_OK:
+        w(f"📊 Total Configurations: {len(listing.configurations)}\n")
+        for config in listing.configurations:
+            buf.writelines(_render_s3_config(config))
+        w(_FOOTER_OK)
+    else:
+        w(f"❌ Status: {listing.status}\n")
+        buf.writelines(_render_validation_errors(listing.validationlist))
+    return buf.getvalue()
+
+
+def list_aws_s3_backup_configurations(format: str = "text") -> str:
+    """List the AWS S3 backup configurations known to DSA.
+
+    format="json" returns the parsed structure as compact JSON instead of the
+    human-readable report.
+    """
+    response = dsa_client._make_request("GET", AWS_S3_ENDPOINT)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[DEBUG] Full DSA API response from aws-s3 endpoint: %r", response)
+
+    listing = S3ConfigList(
+        status=response.status or 'UNKNOWN',
+        configurations=_as_list(response.body.get('aws')),
+        validationlist=response.validationlist,
+    )
+    if format == "json":
+        return _format_json(listing)
+    return _format_s3_text(listing)
+
+
+# Operation dispatch for manage_AWS_S3_backup_configurations.
+_S3_OPS = {
+    "list": lambda args: list_aws_s3_backup_configurations(args["format"]),
+}
+_S3_OPS_STR: Final = ", ".join(_S3_OPS)
+
+
+def manage_AWS_S3_backup_configurations(operation: str, format: str = "text") -> str:
+    """Route an AWS S3 backup-configuration operation to the matching tool function."""
+    fn = _S3_OPS.get(operation)
+    if fn is None:
+        return f"❌ Unknown operation '{operation}'. Available operations: {_S3_OPS_STR}"
+    try:
+        return fn({"format": format})
+    except Exception as e:
+        logger.error(f"Error executing AWS S3 operation '{operation}': {e}")
+        return f"❌ Error executing AWS S3 operation '{operation}': {e}"
+
+
+#------------------ Media server tools ------------------#
+
+def _ttl_cache(ttl: float = 15.0, maxsize: int = 64):
+    """Memoize a function's result by positional args for ttl seconds.
+
+    The media server read helpers are pure GETs against slow-changing DSA
+    topology, so repeated invocations within the window (an LLM iteratively
+    inspecting the cluster) become a dict lookup instead of an HTTPS round
+    trip. The decorated function gains cache_clear() and
+    cache_invalidate(*args) so mutation paths can bound staleness.
+    """
+    def decorator(fn):
+        cache: dict[tuple, tuple[float, object]] = {}
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(args)
+                if entry is not None and entry[0] > now:
+                    return entry[1]
+            value = fn(*args)
+            if isinstance(value, str):
+                # Helpers return formatted error strings on failure; caching
+                # one would replay a transient fault for the whole TTL.
+                return value
+            with lock:
+                if len(cache) >= maxsize:
+                    cache.pop(next(iter(cache)), None)
+                cache[args] = (time.monotonic() + ttl, value)
+            return value
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        def cache_invalidate(*args):
+            with lock:
+                cache.pop(args, None)
+
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_invalidate = cache_invalidate
+        return wrapper
+    return decorator
+
+
+def _extract_errors(response: DsaResponse, action_desc: str) -> str | None:
+    """Return a formatted error message for an invalid DSA response.
+
+    Returns None when the response is valid, so the success path of each
+    helper stays a single straight-line check instead of six copies of the
+    validationlist walk.
+    """
+    if response.valid:
+        return None
+    if vl := response.validationlist:
+        msgs = "\n".join(
+            f"Code {e.get('code', 'N/A')}: {e.get('message', 'Unknown error')}"
+            for e in chain(vl.get("clientValidationList", ()), vl.get("serverValidationList", ()))
+        )
+        if msgs:
+            return f"❌ Failed to {action_desc}:\n{msgs}"
+    return f"❌ Failed to {action_desc}: unknown error"
+
+
+@_ttl_cache(ttl=15.0, maxsize=64)
+def _list_media_servers() -> dict | str:
+    """List all DSA media servers."""
+    try:
+        response = dsa_client._make_request("GET", "dsa/components/mediaservers")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DSA API response: %r", response)
+        err = _extract_errors(response, "list media servers")
+        if err:
+            return err
+        return response.body
+    except Exception as e:
+        logger.error(f"Error listing media servers: {e}")
+        return f"❌ Error listing media servers: {e}"
+
+
+@_ttl_cache(ttl=15.0, maxsize=64)
+def _get_media_server(server_name: str) -> dict | str:
+    """Get the details of a single DSA media server."""
+    try:
+        response = dsa_client._make_request("GET", f"dsa/components/mediaservers/{server_name}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DSA API response: %r", response)
+        err = _extract_errors(response, f"get media server '{server_name}'")
+        if err:
+            return err
+        return response.body
+    except Exception as e:
+        logger.error(f"Error getting media server '{server_name}': {e}")
+        return f"❌ Error getting media server '{server_name}': {e}"
+
+
+# Keys every ip_addresses entry must carry, checked with one set-subset
+# comparison per entry instead of chained membership tests.
+_IP_REQUIRED_KEYS: Final = frozenset(("ipAddress", "netmask"))
+
+
+def _add_media_server(server_name: str, port: int, ip_list: list, pool_shared_pipes: bool = False, virtual: bool = False) -> dict | str:
+    """Add a media server to the DSA configuration."""
+    try:
+        if not isinstance(port, int) or port <= 0 or port > 65535:
+            return f"❌ Invalid port {port}: must be an integer between 1 and 65535"
+        if not isinstance(ip_list, list) or not ip_list:
+            return "❌ ip_addresses must be a non-empty JSON array of {ipAddress, netmask} objects"
+        for ip_info in ip_list:
+            if not isinstance(ip_info, dict) or not _IP_REQUIRED_KEYS <= ip_info.keys():
+                return "❌ Each ip_addresses entry must be an object with 'ipAddress' and 'netmask' keys"
+        payload = {
+            "mediaServerName": server_name,
+            "port": port,
+            "poolSharedPipes": pool_shared_pipes,
+            "virtual": virtual,
+            "ipInfoList": ip_list,
+        }
+        response = dsa_client._make_request("POST", "dsa/components/mediaservers", data=payload)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DSA API response: %r", response)
+        err = _extract_errors(response, f"add media server '{server_name}'")
+        if err:
+            return err
+        _list_media_servers.cache_clear()
+        _get_media_server.cache_invalidate(server_name)
+        return response.body
+    except Exception as e:
+        logger.error(f"Error adding media server '{server_name}': {e}")
+        return f"❌ Error adding media server '{server_name}': {e}"
+
+
+def _delete_media_server(server_name: str) -> dict | str:
+    """Delete a media server from the DSA configuration."""
+    try:
+        response = dsa_client._make_request("DELETE", f"dsa/components/mediaservers/{server_name}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DSA API response: %r", response)
+        err = _extract_errors(response, f"delete media server '{server_name}'")
+        if err:
+            return err
+        _list_media_servers.cache_clear()
+        _get_media_server.cache_invalidate(server_name)
+        return response.body
+    except Exception as e:
+        logger.error(f"Error deleting media server '{server_name}': {e}")
+        return f"❌ Error deleting media server '{server_name}': {e}"
+
+
+@_ttl_cache(ttl=15.0, maxsize=64)
+def _list_media_server_consumers() -> dict | str:
+    """List the consumers (streams) registered against all media servers."""
+    try:
+        response = dsa_client._make_request("GET", "dsa/components/mediaservers/listconsumers")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DSA API response: %r", response)
+        err = _extract_errors(response, "list media server consumers")
+        if err:
+            return err
+        return response.body
+    except Exception as e:
+        logger.error(f"Error listing media server consumers: {e}")
+        return f"❌ Error listing media server consumers: {e}"
+
+
+def _list_media_server_consumers_by_name(server_name: str) -> dict | str:
+    """List the consumers registered against a single media server."""
+    try:
+        response = dsa_client._make_request("GET", f"dsa/components/mediaservers/{server_name}/listconsumers")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DSA API response: %r", response)
+        err = _extract_errors(response, f"list consumers for media server '{server_name}'")
+        if err:
+            return err
+        return response.body
+    except Exception as e:
+        logger.error(f"Error listing consumers for media server '{server_name}': {e}")
+        return f"❌ Error listing consumers for media server '{server_name}': {e}"
+
+
+def _list_media_server_consumers_by_names(server_names: list) -> dict | str:
+    """List consumers for several media servers with one tool call.
+
+    The DSA API only exposes a per-server listconsumers endpoint, so the
+    names are fanned out over a small thread pool; the shared httpx client
+    is thread-safe and its keep-alive pool serves the workers concurrently,
+    collapsing N sequential round trips into roughly one.
+    """
+    names = [n.strip() for n in server_names if isinstance(n, str) and n.strip()]
+    if not names:
+        return "❌ server_names must be a JSON array of media server names"
+    with ThreadPoolExecutor(max_workers=min(8, len(names))) as pool:
+        results = pool.map(_list_media_server_consumers_by_name, names)
+    return dict(zip(names, results))
+
+
+def _dispatch_add(*, server_name, port, ip_addresses, pool_shared_pipes, virtual, **_) -> dict | str:
+    """Decode the add operation's ip_addresses JSON payload, then add."""
+    try:
+        ip_list = loads(ip_addresses)
+    except ValueError as e:
+        return f"❌ ip_addresses must be a JSON array: {e}"
+    return _add_media_server(server_name, port, ip_list, pool_shared_pipes, virtual)
+
+
+def _dispatch_list_consumers_by_servers(*, server_names, **_) -> dict | str:
+    """Decode the batched operation's server_names JSON payload, then fan out."""
+    try:
+        names = loads(server_names)
+    except ValueError as e:
+        return f"❌ server_names must be a JSON array: {e}"
+    if not isinstance(names, list):
+        return "❌ server_names must be a JSON array of media server names"
+    return _list_media_server_consumers_by_names(names)
+
+
+# Operation dispatch for manage_dsa_media_servers: each entry maps the
+# operation to a keyword-only callable that picks exactly the arguments it
+# needs (the rest fall into **_), plus the tuple of required arguments.
+_MEDIA_DISPATCH = {
+    "list": (lambda **_: _list_media_servers(), ()),
+    "get": (lambda *, server_name, **_: _get_media_server(server_name), ("server_name",)),
+    "add": (_dispatch_add, ("server_name", "port", "ip_addresses")),
+    "delete": (lambda *, server_name, **_: _delete_media_server(server_name), ("server_name",)),
+    "list_consumers": (lambda **_: _list_media_server_consumers(), ()),
+    "list_consumers_by_server": (lambda *, server_name, **_: _list_media_server_consumers_by_name(server_name), ("server_name",)),
+    "list_consumers_by_servers": (_dispatch_list_consumers_by_servers, ("server_names",)),
+}
+_VALID_MEDIA_OPS_STR: Final = ", ".join(_MEDIA_DISPATCH)
+
+# Tool responses are machine-consumed, so results ship compact by default;
+# set DSA_PRETTY_JSON=1 to get indented JSON back for interactive debugging.
+_PRETTY_JSON: Final = os.getenv("DSA_PRETTY_JSON", "").lower() in {"1", "true", "yes"}
+
+
+def manage_dsa_media_servers(
+    operation: str,
+    server_name: str | None = None,
+    port: int | None = None,
+    ip_addresses: str | None = None,
+    pool_shared_pipes: bool = False,
+    virtual: bool = False,
+    server_names: str | None = None,
+) -> dict | str:
+    """Route a media server operation to the matching private helper."""
+    # Normalize once at the routing boundary so no helper re-strips (or
+    # forgets to) and URLs, payloads and error messages all see one value.
+    server_name = server_name.strip() if server_name else server_name
+    entry = _MEDIA_DISPATCH.get(operation)
+    if entry is None:
+        return f"❌ Unknown operation '{operation}'. Available operations: {_VALID_MEDIA_OPS_STR}"
+    fn, required = entry
+    if required:
+        args = {"server_name": server_name, "port": port, "ip_addresses": ip_addresses, "server_names": server_names}
+        missing = next((k for k in required if not args[k]), None)
+        if missing:
+            return f"❌ {missing} is required for the {operation} operation"
+    # No blanket try/except here: every helper catches its own failures and
+    # returns a formatted error string, and the add path handles its JSON
+    # decode explicitly, so an outer envelope would only double-log.
+    result = fn(server_name=server_name, port=port, ip_addresses=ip_addresses,
+                pool_shared_pipes=pool_shared_pipes, virtual=virtual, server_names=server_names)
+    if _PRETTY_JSON and isinstance(result, dict):
+        return _fmt(result)
+    return result
+
+
+#------------------ Tool  ------------------#
+# DSA disk file system management tool
+
+# Immutable metadata templates for the tool handlers; per-call metadata is
+# derived with one dict merge instead of re-building the full literal in
+# both the try and except branches.
+_DISK_META_BASE: Final = {"tool_name": "bar_manageDsaDiskFileSystem"}
+_S3_META_BASE: Final = {"tool_name": "bar_manageAWSS3Operations"}
+_MEDIA_META_BASE: Final = {"tool_name": "bar_manageMediaServer"}
+
+def handle_bar_manageDsaDiskFileSystem(
+    conn: TeradataConnection,
+    operation: str,
+    file_system_path: str | None = None,
+    max_files: int | None = None,
+    file_systems: str | None = None,
+    replace_all: bool = False,
+    format: str = "text",
+    *args,
+    **kwargs,
+):
+    """
+    Manage DSA disk file system backup targets.
+
+    Arguments:
+      operation - one of list, config, config_batch, remove, delete_all
+      file_system_path - file system path (required for config and remove)
+      max_files - maximum number of backup files on the file system (required for config)
+      file_systems - JSON array of {"file_system_path": ..., "max_files": ...} objects (required for config_batch)
+      replace_all - for config/config_batch, replace the whole configuration with the requested entries instead of merging
+      format - "text" (default) for the human-readable report, "json" for the parsed structure (list only)
+
+    Returns:
+      ResponseType: formatted response with operation results + metadata
+    """
+    logger.debug("Tool: handle_bar_manageDsaDiskFileSystem: Args: operation: %s, file_system_path: %s, max_files: %s, file_systems: %s, replace_all: %s, format: %s", operation, file_system_path, max_files, file_systems, replace_all, format)
+    try:
+        result = manage_dsa_disk_file_systems(operation, file_system_path, max_files, file_systems, replace_all, format)
+        metadata = _DISK_META_BASE | {"operation": operation, "file_system_path": file_system_path, "max_files": max_files, "success": True}
+        logger.debug("Tool: handle_bar_manageDsaDiskFileSystem: metadata: %s", metadata)
+        return create_response(result, metadata)
+    except Exception as e:
+        logger.error(f"Tool: handle_bar_manageDsaDiskFileSystem: Error: {e}")
+        metadata = _DISK_META_BASE | {"operation": operation, "file_system_path": file_system_path, "error": str(e), "success": False}
+        return create_response(f"❌ Error: {e}", metadata)
+
+
+#------------------ Tool  ------------------#
+# AWS S3 backup configuration tool
+
+def handle_bar_manageAWSS3Operations(conn: TeradataConnection, operation: str, format: str = "text", *args, **kwargs):
+    """
+    Manage DSA AWS S3 backup configurations.
+
+    Arguments:
+      operation - one of list
+      format - "text" (default) for the human-readable report, "json" for the parsed structure
+
+    Returns:
+      ResponseType: formatted response with operation results + metadata
+    """
+    logger.debug("Tool: handle_bar_manageAWSS3Operations: Args: operation: %s, format: %s", operation, format)
+    try:
+        result = manage_AWS_S3_backup_configurations(operation, format)
+        if logger.isEnabledFor(logging.DEBUG):
+            # The result can embed the full bucketsByRegion dump; don't even
+            # stringify it unless DEBUG is on.
+            logger.debug("Tool: handle_bar_manageAWSS3Operations: result: %s", result)
+        metadata = _S3_META_BASE | {"operation": operation, "success": True}
+        logger.debug("Tool: handle_bar_manageAWSS3Operations: metadata: %s", metadata)
+        return create_response(result, metadata)
+    except Exception as e:
+        logger.error(f"Tool: handle_bar_manageAWSS3Operations: Error: {e}")
+        metadata = _S3_META_BASE | {"operation": operation, "error": str(e), "success": False}
+        return create_response(f"❌ Error: {e}", metadata)
+
+
+#------------------ Tool  ------------------#
+# DSA media server management tool
+
+def handle_bar_manageMediaServer(
+    conn: TeradataConnection,
+    operation: str,
+    server_name: str | None = None,
+    port: int | None = None,
+    ip_addresses: str | None = None,
+    pool_shared_pipes: bool = False,
+    virtual: bool = False,
+    server_names: str | None = None,
+    *args,
+    **kwargs,
+):
+    """
+    Manage DSA media servers.
+
+    Arguments:
+      operation - one of list, get, add, delete, list_consumers, list_consumers_by_server, list_consumers_by_servers
+      server_name - media server name (required for get, add, delete, list_consumers_by_server)
+      port - media server port (required for add)
+      ip_addresses - JSON array of {"ipAddress": ..., "netmask": ...} objects (required for add)
+      pool_shared_pipes - whether the media server pools shared pipes
+      virtual - whether the media server is virtual
+      server_names - JSON array of media server names (required for list_consumers_by_servers)
+
+    Returns:
+      ResponseType: formatted response with operation results + metadata
+    """
+    logger.debug("Tool: handle_bar_manageMediaServer: Args: operation: %s, server_name: %s, port: %s, ip_addresses: %s, pool_shared_pipes: %s, virtual: %s, server_names: %s", operation, server_name, port, ip_addresses, pool_shared_pipes, virtual, server_names)
+    try:
+        result = manage_dsa_media_servers(operation, server_name, port, ip_addresses, pool_shared_pipes, virtual, server_names)
+        metadata = _MEDIA_META_BASE | {"operation": operation, "server_name": server_name, "success": True}
+        logger.debug("Tool: handle_bar_manageMediaServer: metadata: %s", metadata)
+        return create_response(result, metadata)
+    except Exception as e:
+        logger.error(f"Tool: handle_bar_manageMediaServer: Error: {e}")
+        metadata = _MEDIA_META_BASE | {"operation": operation, "server_name": server_name, "error": str(e), "success": False}
+        return create_response(f"❌ Error: {e}", metadata)
@@ -0,0 +1,132 @@
+"""HTTP client for the Teradata DSA (Data Stream Architecture) REST API.
+
+All BAR tools talk to the same DSA endpoint, so a single httpx client with
+HTTP/2 and keep-alive connection pooling is shared across the module. Tool
+handlers are invoked synchronously by the MCP adapter in app.py, so the
+client is the synchronous httpx.Client; the shared pool still amortizes the
+TCP/TLS handshake across calls.
+
+Connection settings come from the environment:
+  DSA_BASE_URL   - base URL of the DSA REST API (default https://localhost:9090/)
+  DSA_USER       - user for HTTP basic authentication (optional)
+  DSA_PASSWORD   - password for HTTP basic authentication (optional)
+  DSA_VERIFY_SSL - set to 1/true/yes to verify the DSA TLS certificate
+"""
+
+import logging
+import os
+import threading
+import time
+
+from dataclasses import dataclass
+
+import httpx
+
+try:
+    # orjson's C parser decodes large DSA payloads (e.g. S3 configurations
+    # with thousands of prefixes) several times faster than stdlib json.
+    import orjson
+
+    def _loads(data: bytes):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+
+    def _loads(data: bytes):
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# Same child logger as bar_tools so DSA wire traffic lands in the BAR file
+# log while still propagating to the server-wide handlers.
+logger = logging.getLogger("teradata_mcp_server.bar")
+
+
+@dataclass(slots=True)
+class DsaResponse:
+    """Decoded DSA REST response with the envelope fields pre-extracted.
+
+    Callers read valid/status/validationlist as fixed slot attributes
+    instead of re-probing the body dict; body keeps the full payload for
+    endpoint-specific fields and for returning to the MCP caller.
+    """
+    valid: bool
+    status: str
+    validationlist: dict | None
+    body: dict
+
+
+class DSAClient:
+    """Thin wrapper around the DSA REST API with a shared connection pool."""
+
+    def __init__(self):
+        self.base_url = os.getenv("DSA_BASE_URL", "https://localhost:9090/")
+        verify = os.getenv("DSA_VERIFY_SSL", "false").lower() in {"1", "true", "yes"}
+        user = os.getenv("DSA_USER")
+        password = os.getenv("DSA_PASSWORD")
+        auth = (user, password) if user and password else None
+        transport = httpx.HTTPTransport(
+            http2=True,
+            verify=verify,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+            retries=3,
+        )
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            auth=auth,
+            headers={"Accept": "*/*"},
+            timeout=httpx.Timeout(10.0),
+            transport=transport,
+        )
+        # Short-lived cache for idempotent GETs: {endpoint: (expiry_ts, response)}.
+        self._get_cache: dict[str, tuple[float, DsaResponse]] = {}
+        self._get_cache_lock = threading.Lock()
+
+    def _make_request(self, method: str, endpoint: str, data: dict | None = None, headers: dict | None = None) -> DsaResponse:
+        """Issue a request against the DSA REST API and return the decoded response."""
+        content = None
+        request_headers = headers
+        if data is not None:
+            content = _dumps(data)
+            request_headers = {"Content-Type": "application/json"}
+            if headers:
+                request_headers.update(headers)
+        response = self._client.request(method, endpoint, content=content, headers=request_headers)
+        response.raise_for_status()
+        if method != "GET":
+            # Any write may change what a subsequent GET would return.
+            self._invalidate(endpoint)
+        body = _loads(response.content)
+        return DsaResponse(
+            valid=bool(body.get("valid", False)),
+            status=body.get("status", ""),
+            validationlist=body.get("validationlist"),
+            body=body,
+        )
+
+    def _cached_get(self, endpoint: str, ttl: float = 3.0) -> DsaResponse:
+        """GET with a short TTL cache, so back-to-back read-modify-write calls
+        (e.g. bulk disk file system configuration) skip the redundant fetch."""
+        now = time.monotonic()
+        with self._get_cache_lock:
+            entry = self._get_cache.get(endpoint)
+            if entry and entry[0] > now:
+                logger.debug(f"DSA GET cache hit: {endpoint}")
+                return entry[1]
+        response = self._make_request("GET", endpoint)
+        with self._get_cache_lock:
+            self._get_cache[endpoint] = (time.monotonic() + ttl, response)
+        return response
+
+    def _invalidate(self, endpoint: str) -> None:
+        """Drop any cached GET response for the given endpoint."""
+        with self._get_cache_lock:
+            self._get_cache.pop(endpoint, None)
+
+
+# Module-level singleton shared by all BAR tools.
+dsa_client = DSAClient()
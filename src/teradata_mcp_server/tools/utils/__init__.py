@@ -27,6 +27,18 @@ def serialize_teradata_types(obj: Any) -> Any:
     return str(obj)
 
 
+try:
+    # orjson encodes the response dict in one C call; stdlib json remains the
+    # fallback so the server keeps working when orjson is not installed.
+    import orjson
+
+    def _dumps(resp: dict[str, Any]) -> str:
+        return orjson.dumps(resp, default=serialize_teradata_types, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    def _dumps(resp: dict[str, Any]) -> str:
+        return json.dumps(resp, default=serialize_teradata_types)
+
+
 def rows_to_json(cursor_description: Any, rows: list[Any]) -> list[dict[str, Any]]:
     """Convert DB rows into JSON objects using column names as keys."""
     if not cursor_description or not rows:
@@ -44,11 +56,11 @@ def create_response(data: Any, metadata: dict[str, Any] | None = None, error: di
         resp = {"status": "error", "message": error}
         if metadata:
             resp["metadata"] = metadata
-        return json.dumps(resp, default=serialize_teradata_types)
+        return _dumps(resp)
     resp = {"status": "success", "results": data}
     if metadata:
         resp["metadata"] = metadata
-    return json.dumps(resp, default=serialize_teradata_types)
+    return _dumps(resp)
 
 
 # ------------------------------ Auth helpers ------------------------------ #